@@ -1,10 +1,18 @@
 """pyecospold."""
 __all__ = (
     "__version__",
+    "parse_and_validate_file_v1",
+    "parse_and_validate_file_v2",
     "parse_directory_v1",
     "parse_directory_v2",
+    "parse_directory_iter_v1",
+    "parse_directory_iter_v2",
     "parse_file_v1",
     "parse_file_v2",
+    "parse_file_iter_v1",
+    "parse_file_iter_v2",
+    "parse_stream_v1",
+    "parse_stream_v2",
     "parse_zip_file_v1",
     "parse_zip_file_v2",
     "validate_directory_v1",
@@ -20,10 +28,18 @@ __all__ = (
 
 from .config import Defaults
 from .core import (
+    parse_and_validate_file_v1,
+    parse_and_validate_file_v2,
+    parse_directory_iter_v1,
+    parse_directory_iter_v2,
     parse_directory_v1,
     parse_directory_v2,
+    parse_file_iter_v1,
+    parse_file_iter_v2,
     parse_file_v1,
     parse_file_v2,
+    parse_stream_v1,
+    parse_stream_v2,
     parse_zip_file_v1,
     parse_zip_file_v2,
     save_ecospold_file,
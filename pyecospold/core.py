@@ -1,144 +1,137 @@
 """Core Ecospold module containing parsing and saving functionalities."""
+from __future__ import annotations
+
+from functools import lru_cache
 from io import StringIO
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Tuple, Type, Union
 
 from lxml import etree
-from lxmlh import (
+from lxmlh import save_file
+
+from .config import Defaults
+from .parsers import (
+    parse_and_validate,
     parse_directory,
+    parse_directory_iter,
     parse_file,
+    parse_file_iter,
+    parse_stream,
     parse_zip_file,
-    save_file,
     validate_directory,
     validate_file,
     validate_zip_file,
 )
 
-from .config import Defaults
-from .model_v1 import AdministrativeInformation as AdministrativeInformationV1
-from .model_v1 import Allocation
-from .model_v1 import DataEntryBy as DataEntryByV1
-from .model_v1 import DataGeneratorAndPublication as DataGeneratorAndPublicationV1
-from .model_v1 import Dataset, DataSetInformation
-from .model_v1 import EcoSpold as EcoSpoldV1
-from .model_v1 import Exchange
-from .model_v1 import FlowData as FlowDataV1
-from .model_v1 import Geography as GeographyV1
-from .model_v1 import MetaInformation
-from .model_v1 import ModellingAndValidation as ModellingAndValidationV1
-from .model_v1 import Person, ProcessInformation, ReferenceFunction
-from .model_v1 import Representativeness as RepresentativenessV1
-from .model_v1 import Source
-from .model_v1 import Technology as TechnologyV1
-from .model_v1 import TimePeriod as TimePeriodV1
-from .model_v1 import Validation
-from .model_v2 import Activity, ActivityDataset, ActivityDescription
-from .model_v2 import AdministrativeInformation as AdministrativeInformationV2
-from .model_v2 import Beta, Classification, Compartment
-from .model_v2 import DataEntryBy as DataEntryByV2
-from .model_v2 import DataGeneratorAndPublication as DataGeneratorAndPublicationV2
-from .model_v2 import EcoSpold as EcoSpoldV2
-from .model_v2 import ElementaryExchange, FileAttributes
-from .model_v2 import FlowData as FlowDataV2
-from .model_v2 import Gamma
-from .model_v2 import Geography as GeographyV2
-from .model_v2 import (
-    ImpactIndicator,
-    IntermediateExchange,
-    Lognormal,
-    MacroEconomicScenario,
-)
-from .model_v2 import ModellingAndValidation as ModellingAndValidationV2
-from .model_v2 import Normal, Parameter, PedigreeMatrix, Property
-from .model_v2 import Representativeness as RepresentativenessV2
-from .model_v2 import RequiredContextReference, Review
-from .model_v2 import Technology as TechnologyV2
-from .model_v2 import TextAndImage
-from .model_v2 import TimePeriod as TimePeriodV2
-from .model_v2 import TransferCoefficient, Triangular, Uncertainty, Uniform
-
-
-class EcospoldLookupV1(etree.CustomElementClassLookup):
-    """Custom XML lookup class for Ecospold V1 files."""
-
-    def lookup(self, unused_node_type, unused_document, unused_namespace, name):
-        """Maps Ecospold XML elements to custom Ecospold classes."""
-        lookupmap = {
-            "administrativeInformation": AdministrativeInformationV1,
-            "allocation": Allocation,
-            "dataEntryBy": DataEntryByV1,
-            "dataGeneratorAndPublication": DataGeneratorAndPublicationV1,
-            "dataset": Dataset,
-            "dataSetInformation": DataSetInformation,
-            "ecoSpold": EcoSpoldV1,
-            "exchange": Exchange,
-            "flowData": FlowDataV1,
-            "geography": GeographyV1,
-            "metaInformation": MetaInformation,
-            "modellingAndValidation": ModellingAndValidationV1,
-            "person": Person,
-            "processInformation": ProcessInformation,
-            "referenceFunction": ReferenceFunction,
-            "representativeness": RepresentativenessV1,
-            "source": Source,
-            "technology": TechnologyV1,
-            "timePeriod": TimePeriodV1,
-            "validation": Validation,
-        }
-        try:
-            return lookupmap[name]
-        except KeyError:
-            return None
-
-
-class EcospoldLookupV2(etree.CustomElementClassLookup):
-    """Custom XML lookup class for Ecospold V2 files."""
-
-    def lookup(self, unused_node_type, unused_document, unused_namespace, name):
-        """Maps Ecospold XML elements to custom Ecospold classes."""
-        lookupmap = {
-            "activity": Activity,
-            "activityDataset": ActivityDataset,
-            "activityDescription": ActivityDescription,
-            "administrativeInformation": AdministrativeInformationV2,
-            "allocationComment": TextAndImage,
-            "childActivityDataset": ActivityDataset,
-            "beta": Beta,
-            "classification": Classification,
-            "comment": TextAndImage,
-            "compartment": Compartment,
-            "dataEntryBy": DataEntryByV2,
-            "dataGeneratorAndPublication": DataGeneratorAndPublicationV2,
-            "ecoSpold": EcoSpoldV2,
-            "elementaryExchange": ElementaryExchange,
-            "fileAttributes": FileAttributes,
-            "flowData": FlowDataV2,
-            "generalComment": TextAndImage,
-            "gamma": Gamma,
-            "geography": GeographyV2,
-            "impactIndicator": ImpactIndicator,
-            "intermediateExchange": IntermediateExchange,
-            "lognormal": Lognormal,
-            "macroEconomicScenario": MacroEconomicScenario,
-            "modellingAndValidation": ModellingAndValidationV2,
-            "normal": Normal,
-            "parameter": Parameter,
-            "pedigreeMatrix": PedigreeMatrix,
-            "property": Property,
-            "representativeness": RepresentativenessV2,
-            "requiredContexts": RequiredContextReference,
-            "review": Review,
-            "technology": TechnologyV2,
-            "timePeriod": TimePeriodV2,
-            "transferCoefficient": TransferCoefficient,
-            "triangular": Triangular,
-            "uncertainty": Uncertainty,
-            "uniform": Uniform,
-        }
-        try:
-            return lookupmap[name]
-        except KeyError:
-            return None
+if TYPE_CHECKING:
+    from .model_v1 import Dataset
+    from .model_v1 import EcoSpold as EcoSpoldV1
+    from .model_v2 import ActivityDataset
+    from .model_v2 import EcoSpold as EcoSpoldV2
+
+
+@lru_cache(maxsize=None)
+def _get_lookup_map_v1() -> Dict[str, Type[etree.ElementBase]]:
+    """Maps Ecospold V1 XML element names to custom Ecospold classes. The V1 classes
+    are only imported on first use."""
+    from . import model_v1  # pylint: disable=import-outside-toplevel
+
+    return {
+        "administrativeInformation": model_v1.AdministrativeInformation,
+        "allocation": model_v1.Allocation,
+        "dataEntryBy": model_v1.DataEntryBy,
+        "dataGeneratorAndPublication": model_v1.DataGeneratorAndPublication,
+        "dataset": model_v1.Dataset,
+        "dataSetInformation": model_v1.DataSetInformation,
+        "ecoSpold": model_v1.EcoSpold,
+        "exchange": model_v1.Exchange,
+        "flowData": model_v1.FlowData,
+        "geography": model_v1.Geography,
+        "metaInformation": model_v1.MetaInformation,
+        "modellingAndValidation": model_v1.ModellingAndValidation,
+        "person": model_v1.Person,
+        "processInformation": model_v1.ProcessInformation,
+        "referenceFunction": model_v1.ReferenceFunction,
+        "representativeness": model_v1.Representativeness,
+        "source": model_v1.Source,
+        "technology": model_v1.Technology,
+        "timePeriod": model_v1.TimePeriod,
+        "validation": model_v1.Validation,
+    }
+
+
+@lru_cache(maxsize=None)
+def _get_lookup_map_v2() -> Dict[str, Type[etree.ElementBase]]:
+    """Maps Ecospold V2 XML element names to custom Ecospold classes. The V2 classes
+    are only imported on first use."""
+    from . import model_v2  # pylint: disable=import-outside-toplevel
+
+    return {
+        "activity": model_v2.Activity,
+        "activityDataset": model_v2.ActivityDataset,
+        "activityDescription": model_v2.ActivityDescription,
+        "administrativeInformation": model_v2.AdministrativeInformation,
+        "allocationComment": model_v2.TextAndImage,
+        "childActivityDataset": model_v2.ActivityDataset,
+        "beta": model_v2.Beta,
+        "classification": model_v2.Classification,
+        "comment": model_v2.TextAndImage,
+        "compartment": model_v2.Compartment,
+        "dataEntryBy": model_v2.DataEntryBy,
+        "dataGeneratorAndPublication": model_v2.DataGeneratorAndPublication,
+        "ecoSpold": model_v2.EcoSpold,
+        "elementaryExchange": model_v2.ElementaryExchange,
+        "fileAttributes": model_v2.FileAttributes,
+        "flowData": model_v2.FlowData,
+        "generalComment": model_v2.TextAndImage,
+        "gamma": model_v2.Gamma,
+        "geography": model_v2.Geography,
+        "impactIndicator": model_v2.ImpactIndicator,
+        "intermediateExchange": model_v2.IntermediateExchange,
+        "lognormal": model_v2.Lognormal,
+        "macroEconomicScenario": model_v2.MacroEconomicScenario,
+        "modellingAndValidation": model_v2.ModellingAndValidation,
+        "normal": model_v2.Normal,
+        "parameter": model_v2.Parameter,
+        "pedigreeMatrix": model_v2.PedigreeMatrix,
+        "property": model_v2.Property,
+        "representativeness": model_v2.Representativeness,
+        "requiredContexts": model_v2.RequiredContextReference,
+        "review": model_v2.Review,
+        "technology": model_v2.Technology,
+        "timePeriod": model_v2.TimePeriod,
+        "transferCoefficient": model_v2.TransferCoefficient,
+        "triangular": model_v2.Triangular,
+        "uncertainty": model_v2.Uncertainty,
+        "uniform": model_v2.Uniform,
+    }
+
+
+class EcospoldLookupV1(etree.ElementNamespaceClassLookup):
+    """Custom XML lookup class for Ecospold V1 files. Elements are mapped by lxml
+    itself within the Ecospold V1 namespace only."""
+
+    NAMESPACES = ("http://www.EcoInvent.org/EcoSpold01",)
+
+    def __init__(self):
+        super().__init__()
+        for namespace in self.NAMESPACES:
+            self.get_namespace(namespace).update(_get_lookup_map_v1())
+
+
+class EcospoldLookupV2(etree.ElementNamespaceClassLookup):
+    """Custom XML lookup class for Ecospold V2 files. Elements are mapped by lxml
+    itself within the Ecospold V2 and V2 child namespaces only."""
+
+    NAMESPACES = (
+        "http://www.EcoInvent.org/EcoSpold02",
+        "http://www.EcoInvent.org/EcoSpold02Child",
+    )
+
+    def __init__(self):
+        super().__init__()
+        for namespace in self.NAMESPACES:
+            self.get_namespace(namespace).update(_get_lookup_map_v2())
 
 
 def parse_file_v1(file: Union[str, Path, StringIO]) -> EcoSpoldV1:
@@ -149,7 +142,7 @@ def parse_file_v1(file: Union[str, Path, StringIO]) -> EcoSpoldV1:
 
     Returns an EcoSpold class representing the root of the XML file.
     """
-    return parse_file(file, Defaults.SCHEMA_V1_FILE, EcospoldLookupV1())
+    return parse_file(file, Defaults.SCHEMA_V1_FILE, EcospoldLookupV1)
 
 
 def parse_file_v2(file: Union[str, Path, StringIO]) -> EcoSpoldV2:
@@ -160,7 +153,92 @@ def parse_file_v2(file: Union[str, Path, StringIO]) -> EcoSpoldV2:
 
     Returns an EcoSpold class representing the root of the XML file.
     """
-    return parse_file(file, Defaults.SCHEMA_V2_FILE, EcospoldLookupV2())
+    return parse_file(file, Defaults.SCHEMA_V2_FILE, EcospoldLookupV2)
+
+
+def parse_stream_v1(chunks: Iterable[Union[bytes, str]]) -> EcoSpoldV1:
+    """Parses an Ecospold V1 XML document to custom Ecospold classes while its chunks
+    arrive, e.g. from an HTTP response or stdin.
+
+    Parameters:
+    chunks: an iterable of the document's consecutive bytes|str chunks.
+
+    Returns an EcoSpold class representing the root of the XML document.
+    """
+    return parse_stream(chunks, Defaults.SCHEMA_V1_FILE, EcospoldLookupV1)
+
+
+def parse_stream_v2(chunks: Iterable[Union[bytes, str]]) -> EcoSpoldV2:
+    """Parses an Ecospold V2 XML document to custom Ecospold classes while its chunks
+    arrive, e.g. from an HTTP response or stdin.
+
+    Parameters:
+    chunks: an iterable of the document's consecutive bytes|str chunks.
+
+    Returns an EcoSpold class representing the root of the XML document.
+    """
+    return parse_stream(chunks, Defaults.SCHEMA_V2_FILE, EcospoldLookupV2)
+
+
+def parse_file_iter_v1(file: Union[str, Path, StringIO]) -> Iterator[Dataset]:
+    """Incrementally parses an Ecospold V1 XML file, yielding one dataset at a time.
+    Useful for large files, as every dataset is released once the next one is
+    requested.
+
+    Parameters:
+    file: the str|Path path to the Ecospold XML file or its StringIO representation.
+
+    Returns an iterator of Dataset classes.
+    """
+    return parse_file_iter(
+        file, Defaults.SCHEMA_V1_FILE, EcospoldLookupV1, tag="{*}dataset"
+    )
+
+
+def parse_file_iter_v2(file: Union[str, Path, StringIO]) -> Iterator[ActivityDataset]:
+    """Incrementally parses an Ecospold V2 XML file, yielding one activity dataset
+    at a time. Useful for large files, as every activity dataset is released once
+    the next one is requested.
+
+    Parameters:
+    file: the str|Path path to the Ecospold XML file or its StringIO representation.
+
+    Returns an iterator of ActivityDataset classes.
+    """
+    return parse_file_iter(
+        file,
+        Defaults.SCHEMA_V2_FILE,
+        EcospoldLookupV2,
+        tag=("{*}activityDataset", "{*}childActivityDataset"),
+    )
+
+
+def parse_and_validate_file_v1(
+    file: Union[str, Path, StringIO]
+) -> Tuple[EcoSpoldV1, Union[None, List[str]]]:
+    """Parses and validates an Ecospold V1 XML file in a single read.
+
+    Parameters:
+    file: the str|Path path to the Ecospold XML file or its StringIO representation.
+
+    Returns a tuple of an EcoSpold class representing the root of the XML file and
+    ``None`` if valid or a list of error strings.
+    """
+    return parse_and_validate(file, Defaults.SCHEMA_V1_FILE, EcospoldLookupV1)
+
+
+def parse_and_validate_file_v2(
+    file: Union[str, Path, StringIO]
+) -> Tuple[EcoSpoldV2, Union[None, List[str]]]:
+    """Parses and validates an Ecospold V2 XML file in a single read.
+
+    Parameters:
+    file: the str|Path path to the Ecospold XML file or its StringIO representation.
+
+    Returns a tuple of an EcoSpold class representing the root of the XML file and
+    ``None`` if valid or a list of error strings.
+    """
+    return parse_and_validate(file, Defaults.SCHEMA_V2_FILE, EcospoldLookupV2)
 
 
 def validate_file_v1(file: Union[str, Path, StringIO]) -> Union[None, List[str]]:
@@ -204,7 +282,7 @@ def parse_directory_v1(
     return parse_directory(
         dir_path=dir_path,
         schema_path=Defaults.SCHEMA_V1_FILE,
-        lookup=EcospoldLookupV1(),
+        lookup=EcospoldLookupV1,
         valid_suffixes=valid_suffixes,
     )
 
@@ -228,7 +306,57 @@ def parse_directory_v2(
     return parse_directory(
         dir_path=dir_path,
         schema_path=Defaults.SCHEMA_V2_FILE,
-        lookup=EcospoldLookupV2(),
+        lookup=EcospoldLookupV2,
+        valid_suffixes=valid_suffixes,
+    )
+
+
+def parse_directory_iter_v1(
+    dir_path: Union[str, Path], valid_suffixes: Union[List[str], None] = None
+) -> Iterator[Tuple[Path, EcoSpoldV1]]:
+    """Lazily parses a directory of Ecospold XML files to custom Ecospold classes,
+    one file at a time. Preferred over parse_directory_v1 for large directories.
+
+    Parameters:
+    dir_path: the directory path, should contain files of version 1 of EcoSpold.
+    valid_suffixes: a list of valid file suffixes which will only be considered for
+    parsing. If None, defaults to [".xml", ".spold"].
+
+    Returns an iterator of tuples of file paths and corresponding EcoSpold classes
+    representing the root of the XML file.
+    """
+    if valid_suffixes is None:
+        valid_suffixes = [".xml", ".spold"]
+
+    return parse_directory_iter(
+        dir_path=dir_path,
+        schema_path=Defaults.SCHEMA_V1_FILE,
+        lookup=EcospoldLookupV1,
+        valid_suffixes=valid_suffixes,
+    )
+
+
+def parse_directory_iter_v2(
+    dir_path: Union[str, Path], valid_suffixes: Union[List[str], None] = None
+) -> Iterator[Tuple[Path, EcoSpoldV2]]:
+    """Lazily parses a directory of Ecospold XML files to custom Ecospold classes,
+    one file at a time. Preferred over parse_directory_v2 for large directories.
+
+    Parameters:
+    dir_path: the directory path, should contain files of version 2 of EcoSpold.
+    valid_suffixes: a list of valid file suffixes which will only be considered for
+    parsing. If None, defaults to [".xml", ".spold"].
+
+    Returns an iterator of tuples of file paths and corresponding EcoSpold classes
+    representing the root of the XML file.
+    """
+    if valid_suffixes is None:
+        valid_suffixes = [".xml", ".spold"]
+
+    return parse_directory_iter(
+        dir_path=dir_path,
+        schema_path=Defaults.SCHEMA_V2_FILE,
+        lookup=EcospoldLookupV2,
         valid_suffixes=valid_suffixes,
     )
 
@@ -294,7 +422,7 @@ def parse_zip_file_v1(
     return parse_zip_file(
         file_path=file_path,
         schema_path=Defaults.SCHEMA_V1_FILE,
-        lookup=EcospoldLookupV1(),
+        lookup=EcospoldLookupV1,
         valid_suffixes=valid_suffixes,
     )
 
@@ -318,7 +446,7 @@ def parse_zip_file_v2(
     return parse_zip_file(
         file_path=file_path,
         schema_path=Defaults.SCHEMA_V2_FILE,
-        lookup=EcospoldLookupV2(),
+        lookup=EcospoldLookupV2,
         valid_suffixes=valid_suffixes,
     )
 
@@ -366,7 +494,10 @@ def validate_zip_file_v2(
 
 
 def save_ecospold_file(
-    root: etree.ElementBase, path: str, fill_defaults: bool = False
+    root: etree.ElementBase,
+    path: str,
+    fill_defaults: bool = False,
+    pretty_print: bool = True,
 ) -> None:
     """Saves an Ecospold class to an XML file.
 
@@ -374,6 +505,7 @@ def save_ecospold_file(
     root: the EcoSpold class representing the root of the XML file.
     path: the path to save the Ecospold XML file.
     fill_defaults: whether to fill defaults values for attributes or not.
+    pretty_print: whether to indent the XML file or not, disabling it is faster.
     """
     if not fill_defaults:
         staticDefaults = None
@@ -383,5 +515,9 @@ def save_ecospold_file(
         dynamicDefaults = Defaults.DYNAMIC_DEFAULTS
 
     save_file(
-        root, path, static_defaults=staticDefaults, dynamic_defaults=dynamicDefaults
+        root,
+        path,
+        pretty_print=pretty_print,
+        static_defaults=staticDefaults,
+        dynamic_defaults=dynamicDefaults,
     )
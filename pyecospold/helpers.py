@@ -1,44 +1,114 @@
 """Internal helper classes."""
-from typing import Callable, Optional
+from typing import Any, Callable, List, Optional
 
-from lxmlh import create_attribute, create_attribute_list, create_element_text
+from lxml import etree
+from lxmlh.helpers import (
+    get_attribute,
+    get_attribute_list,
+    get_element,
+    get_element_list,
+    get_element_text,
+)
 
 from .config import Defaults
+from .parsers import _get_schema
+
+
+def _set_attribute(
+    element: etree.ElementBase,
+    key: str,
+    value: str,
+    schema_file: str,
+    validator: Optional[Callable],
+) -> None:
+    """Helper method for setting XML attributes. Raises DocumentInvalid
+    exception on inappropriate setting according to the thread's cached XSD schema."""
+    if validator is not None:
+        value = validator(value)
+    element.set(key, str(value))
+    _get_schema(schema_file).assertValid(element.getroottree())
+
+
+def _set_attribute_list(
+    element: etree.ElementBase, key: str, values: List[Any], schema_file: str
+) -> None:
+    """Helper method for setting XML list attributes. Raises DocumentInvalid
+    exception on inappropriate setting according to the thread's cached XSD schema."""
+    for oldValue in get_element_list(element, key):
+        element.remove(oldValue)
+    nameSpace = element.nsmap.get(None, "")
+    for value in values:
+        etree.SubElement(element, f"{{{nameSpace}}}{key}").text = str(value)
+    _get_schema(schema_file).assertValid(element.getroottree())
+
+
+def _set_element_text(
+    parent: etree.ElementBase, element: str, value: str, schema_file: str
+) -> None:
+    """Helper method for setting XML element text. Raises DocumentInvalid exception
+    on inappropriate setting according to the thread's cached XSD schema."""
+    get_element(parent, element).text = str(value)
+    _get_schema(schema_file).assertValid(parent.getroottree())
+
+
+def _create_attribute(
+    name: str, attr_type: type, schema_file: str, validator: Optional[Callable]
+) -> property:
+    return property(
+        fget=lambda self: get_attribute(self, name, attr_type),
+        fset=lambda self, value: _set_attribute(
+            self, name, value, schema_file, validator
+        ),
+    )
+
+
+def _create_attribute_list(name: str, attr_type: type, schema_file: str) -> property:
+    return property(
+        fget=lambda self: get_attribute_list(self, name, attr_type),
+        fset=lambda self, values: _set_attribute_list(self, name, values, schema_file),
+    )
+
+
+def _create_element_text(name: str, element_type: type, schema_file: str) -> property:
+    return property(
+        fget=lambda self: get_element_text(self, name, element_type),
+        fset=lambda self, value: _set_element_text(self, name, value, schema_file),
+    )
 
 
 def create_attribute_v1(
     name: str, attr_type: type, validator: Optional[Callable] = None
 ) -> property:
     """Helper wrapper method for creating setters and getters for a V1 attribute"""
-    return create_attribute(name, attr_type, Defaults.SCHEMA_V1_FILE, validator)
+    return _create_attribute(name, attr_type, Defaults.SCHEMA_V1_FILE, validator)
 
 
 def create_attribute_v2(
     name: str, attr_type: type, validator: Optional[Callable] = None
 ) -> property:
     """Helper wrapper method for creating setters and getters for a V2 attribute"""
-    return create_attribute(name, attr_type, Defaults.SCHEMA_V2_FILE, validator)
+    return _create_attribute(name, attr_type, Defaults.SCHEMA_V2_FILE, validator)
 
 
 def create_attribute_list_v1(name: str, attr_type: type) -> property:
     """Helper wrapper method for creating setters and getters for
     a V1 attribute list"""
-    return create_attribute_list(name, attr_type, Defaults.SCHEMA_V1_FILE)
+    return _create_attribute_list(name, attr_type, Defaults.SCHEMA_V1_FILE)
 
 
 def create_attribute_list_v2(name: str, attr_type: type) -> property:
     """Helper wrapper method for creating setters and getters for
     a V2 attribute list"""
-    return create_attribute_list(name, attr_type, Defaults.SCHEMA_V2_FILE)
+    return _create_attribute_list(name, attr_type, Defaults.SCHEMA_V2_FILE)
 
 
 def create_element_text_v1(name: str, element_type: type) -> property:
     """Helper wrapper method for creating setters and getters for
     a V1 element text"""
-    return create_element_text(name, element_type, Defaults.SCHEMA_V1_FILE)
+    return _create_element_text(name, element_type, Defaults.SCHEMA_V1_FILE)
 
 
 def create_element_text_v2(name: str, element_type: type) -> property:
     """Helper wrapper method for creating setters and getters for
     a V2 element text"""
-    return create_element_text(name, element_type, Defaults.SCHEMA_V2_FILE)
+    return _create_element_text(name, element_type, Defaults.SCHEMA_V2_FILE)
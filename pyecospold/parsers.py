@@ -0,0 +1,369 @@
+"""XML parsing and validation methods used by the Ecospold core module."""
+import codecs
+import os
+import re
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO, TextIOBase
+from pathlib import Path
+from typing import Iterable, Iterator, List, Sequence, Tuple, Type, Union
+
+from lxml import etree
+
+_PARALLEL_MIN_FILES = 4
+_ENCODING_DECLARATION = re.compile(r"\s*<\?xml[^>]*?\bencoding\s*=\s*[\"']([^\"']+)")
+_threadCache = threading.local()
+
+
+def _get_schema(schema_path: str) -> etree.XMLSchema:
+    """Compiles the XSD schema at schema_path once per thread and reuses it
+    afterwards. Schemas are kept per thread as each validation overwrites the
+    error log of the schema it was run with."""
+    schemas = getattr(_threadCache, "schemas", None)
+    if schemas is None:
+        schemas = _threadCache.schemas = {}
+    if schema_path not in schemas:
+        schemas[schema_path] = etree.XMLSchema(file=schema_path)
+    return schemas[schema_path]
+
+
+def _get_parser(
+    schema_path: str,
+    lookup_cls: Type[etree.ElementClassLookup],
+    validating: bool = True,
+) -> etree.XMLParser:
+    """Builds the parser for a schema and lookup class pair once per thread and
+    reuses it afterwards. Parsers are kept per thread as lxml serializes all parsing
+    done through the same parser. Blank text nodes and xml:id lookups are not kept
+    as nothing in the Ecospold classes uses them, and entities are not resolved.
+    Parsers built with validating set to False skip validating against the schema.
+    """
+    parsers = getattr(_threadCache, "parsers", None)
+    if parsers is None:
+        parsers = _threadCache.parsers = {}
+    key = (schema_path, lookup_cls, validating)
+    if key not in parsers:
+        parser = etree.XMLParser(
+            schema=_get_schema(schema_path) if validating else None,
+            remove_blank_text=True,
+            collect_ids=False,
+            huge_tree=True,
+            resolve_entities=False,
+        )
+        parser.set_element_class_lookup(lookup_cls())
+        parsers[key] = parser
+    return parsers[key]
+
+
+def _is_utf8(encoding: str) -> bool:
+    """Checks whether encoding is a name of UTF-8."""
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
+
+
+def _list_files(dir_path: Union[str, Path], valid_suffixes: List[str]) -> List[str]:
+    """Lists the paths of the files directly in dir_path having one of the
+    valid_suffixes, using the file types cached by os.scandir. Suffixes are
+    matched case-insensitively."""
+    suffixes = frozenset(suffix.lower() for suffix in valid_suffixes)
+    with os.scandir(Path(dir_path).resolve()) as entries:
+        return [
+            entry.path
+            for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in suffixes
+        ]
+
+
+def parse_file(
+    file: Union[str, Path, StringIO],
+    schema_path: str,
+    lookup: Type[etree.ElementClassLookup],
+) -> etree.ElementBase:
+    """Parses an XML file to custom classes. Paths are read by libxml2 directly
+    without holding the GIL, which is faster than passing file objects or memory
+    maps that are read through Python.
+
+    Parameters:
+    file: the str|Path path to the XML file or its StringIO representation.
+    schema_path: the path to the XSD schema file.
+    lookup: the lookup class (not an instance) for mapping XML elements to python
+    classes.
+
+    Returns a custom ElementBase class representing the root of the XML file.
+    """
+    return etree.parse(file, _get_parser(schema_path, lookup)).getroot()
+
+
+def parse_stream(
+    chunks: Iterable[Union[bytes, str]],
+    schema_path: str,
+    lookup: Type[etree.ElementClassLookup],
+) -> etree.ElementBase:
+    """Parses an XML document to custom classes while its chunks arrive, e.g. from
+    an HTTP response or stdin, instead of waiting for the whole document first.
+
+    Parameters:
+    chunks: an iterable of the document's consecutive bytes|str chunks.
+    schema_path: the path to the XSD schema file.
+    lookup: the lookup class (not an instance) for mapping XML elements to python
+    classes.
+
+    Returns a custom ElementBase class representing the root of the XML document.
+    """
+    parser = _get_parser(schema_path, lookup).copy()
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser.close()
+
+
+def parse_file_iter(
+    file: Union[str, Path, StringIO],
+    schema_path: str,
+    lookup: Type[etree.ElementClassLookup],
+    tag: Union[str, Sequence[str]],
+) -> Iterator[etree.ElementBase]:
+    """Incrementally parses an XML file, yielding every element matching tag as a
+    custom class once it has been completely read.
+
+    Each yielded element is cleared, and its already processed siblings removed,
+    as soon as iteration continues, so memory use stays bounded by one record
+    instead of the whole document. Consumers must therefore be done with an
+    element before requesting the next one.
+
+    Parameters:
+    file: the str|Path path to the XML file or its StringIO representation, which
+    is passed on UTF-8 encoded as lxml only iterparses bytes. Like parse_file, a
+    StringIO declaring any other encoding is rejected with a ValueError.
+    schema_path: the path to the XSD schema file.
+    lookup: the lookup class (not an instance) for mapping XML elements to python
+    classes.
+    tag: the tag or sequence of tags of the yielded elements, "{*}" matches any
+    namespace.
+
+    Returns an iterator of custom ElementBase classes matching tag.
+    """
+    if isinstance(file, TextIOBase):
+        text = file.read()
+        declaration = _ENCODING_DECLARATION.match(text)
+        if declaration and not _is_utf8(declaration.group(1)):
+            raise ValueError(
+                "Unicode strings with encoding declaration are not supported. "
+                "Please use bytes input or XML fragments without declaration."
+            )
+        file = BytesIO(text.encode("utf-8"))
+    context = etree.iterparse(
+        file,
+        events=("end",),
+        tag=tag,
+        schema=_get_schema(schema_path),
+        remove_blank_text=True,
+        huge_tree=True,
+        resolve_entities=False,
+    )
+    context.set_element_class_lookup(lookup())
+    for _, element in context:
+        yield element
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+def parse_and_validate(
+    file: Union[str, Path, StringIO],
+    schema_path: str,
+    lookup: Type[etree.ElementClassLookup],
+) -> Tuple[etree.ElementBase, Union[None, List[str]]]:
+    """Parses an XML file to custom classes and validates it against a given schema,
+    reading the file only once. Unlike parse_file, invalid files are still parsed.
+    Entities are not resolved, and references to them are left out of the tree.
+
+    Parameters:
+    file: the str|Path path to the XML file or its StringIO representation.
+    schema_path: the path to the XSD schema file.
+    lookup: the lookup class (not an instance) for mapping XML elements to python
+    classes.
+
+    Returns a tuple of the custom ElementBase class representing the root of the
+    XML file and ``None`` if the file validates, or a list of errors as strings.
+    """
+    schema = _get_schema(schema_path)
+    doc = etree.parse(file, _get_parser(schema_path, lookup, validating=False))
+    if doc.docinfo.internalDTD is not None:
+        # Unresolved entity references abort schema validation with an internal error.
+        etree.strip_tags(doc, etree.Entity)
+    if not schema.validate(doc):
+        return doc.getroot(), schema.error_log
+    return doc.getroot(), None
+
+
+def validate_file(
+    file: Union[str, Path, StringIO],
+    schema_path: str,
+) -> Union[None, List[str]]:
+    """Validates a file against a given schema. Entities are not resolved, and
+    references to them are left out of the validated document.
+
+    Parameters:
+    file: the str|Path path to the XML file or its StringIO representation.
+    schema_path: the path to the XSD schema file.
+
+    Returns ``None`` if the file validates, or a list of errors as strings.
+    """
+    schema = _get_schema(schema_path)
+    parser = _get_parser(schema_path, etree.ElementDefaultClassLookup, validating=False)
+    doc = etree.parse(file, parser)
+    if doc.docinfo.internalDTD is not None:
+        # Unresolved entity references abort schema validation with an internal error.
+        etree.strip_tags(doc, etree.Entity)
+    if not schema.validate(doc):
+        return schema.error_log
+    return None
+
+
+def parse_directory(
+    dir_path: Union[str, Path],
+    schema_path: str,
+    lookup: Type[etree.ElementClassLookup],
+    valid_suffixes: Union[List[str], None] = None,
+    max_workers: Union[int, None] = None,
+) -> List[Tuple[Path, etree.ElementBase]]:
+    """Parses a directory of XML files to a list of custom Python classes.
+    Files are parsed concurrently in a thread pool, as libxml2 releases the GIL
+    while parsing and validating.
+
+    Parameters:
+    dir_path: the directory path, should contain files of only the schema_path version.
+    schema_path: the path to the XSD schema file.
+    lookup: the lookup class (not an instance) for mapping XML elements to custom
+    Python classes.
+    valid_suffixes: a list of valid file suffixes which will only be considered for
+    parsing. If None, defaults to [".xml"].
+    max_workers: the maximum number of parsing threads. If None, defaults to the
+    number of CPUs. Files are parsed sequentially if 1.
+
+    Returns a list of tuples of file paths and corresponding custom Python classes
+    representing the root of the XML file.
+    """
+    if valid_suffixes is None:
+        valid_suffixes = [".xml"]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    filePaths = _list_files(dir_path, valid_suffixes)
+
+    def parse(file_path: str) -> Tuple[Path, etree.ElementBase]:
+        return (
+            Path(file_path),
+            parse_file(file=file_path, schema_path=schema_path, lookup=lookup),
+        )
+
+    if max_workers <= 1 or len(filePaths) < _PARALLEL_MIN_FILES:
+        return list(map(parse, filePaths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(parse, filePaths))
+
+
+def parse_directory_iter(
+    dir_path: Union[str, Path],
+    schema_path: str,
+    lookup: Type[etree.ElementClassLookup],
+    valid_suffixes: Union[List[str], None] = None,
+) -> Iterator[Tuple[Path, etree.ElementBase]]:
+    """Lazily parses a directory of XML files to custom Python classes, one file at
+    a time, so only the files still referenced by the caller are kept in memory.
+
+    Parameters:
+    dir_path: the directory path, should contain files of only the schema_path version.
+    schema_path: the path to the XSD schema file.
+    lookup: the lookup class (not an instance) for mapping XML elements to custom
+    Python classes.
+    valid_suffixes: a list of valid file suffixes which will only be considered for
+    parsing. If None, defaults to [".xml"].
+
+    Returns an iterator of tuples of file paths and corresponding custom Python
+    classes representing the root of the XML file.
+    """
+    if valid_suffixes is None:
+        valid_suffixes = [".xml"]
+
+    for file_path in _list_files(dir_path, valid_suffixes):
+        yield (
+            Path(file_path),
+            parse_file(file=file_path, schema_path=schema_path, lookup=lookup),
+        )
+
+
+def validate_directory(
+    dir_path: Union[str, Path],
+    schema_path: str,
+    valid_suffixes: Union[List[str], None] = None,
+) -> List[Tuple[Path, Union[None, List[str]]]]:
+    """Validates a directory of XML files against a given schema.
+
+    Parameters:
+    dir_path: the directory path, should contain files of only the schema_path version.
+    schema_path: the path to the XSD schema file.
+    valid_suffixes: a list of valid file suffixes which will only be considered for
+    validating. If None, defaults to [".xml"].
+
+    Returns a list of tuples of file paths and corresponding list of errors, which
+    is ``None`` if no errors.
+    """
+    if valid_suffixes is None:
+        valid_suffixes = [".xml"]
+
+    return [
+        (Path(file_path), validate_file(file=file_path, schema_path=schema_path))
+        for file_path in _list_files(dir_path, valid_suffixes)
+    ]
+
+
+def parse_zip_file(
+    file_path: Union[str, Path],
+    schema_path: str,
+    lookup: Type[etree.ElementClassLookup],
+    valid_suffixes: Union[List[str], None] = None,
+) -> List[Tuple[Path, etree.ElementBase]]:
+    """Parses a ZIP file of XML files to a list of custom Python classes.
+
+    Parameters:
+    file_path: the ZIP file path, should contain files of only the schema_path version.
+    schema_path: the path to the XSD schema file.
+    lookup: the lookup class (not an instance) for mapping XML elements to custom
+    Python classes.
+    valid_suffixes: a list of valid file suffixes which will only be considered for
+    parsing. If None, defaults to [".xml"].
+
+    Returns a list of tuples of file paths and corresponding custom Python classes
+    representing the root of the XML file.
+    """
+    with tempfile.TemporaryDirectory() as unzipDir:
+        with zipfile.ZipFile(file_path, "r") as zipFile:
+            zipFile.extractall(unzipDir)
+            return parse_directory(unzipDir, schema_path, lookup, valid_suffixes)
+
+
+def validate_zip_file(
+    file_path: Union[str, Path],
+    schema_path: str,
+    valid_suffixes: Union[List[str], None] = None,
+) -> List[Tuple[Path, Union[None, List[str]]]]:
+    """Validates a ZIP file of XML files against a given schema.
+
+    Parameters:
+    file_path: the ZIP file path, should contain files of only the schema_path version.
+    schema_path: the path to the XSD schema file.
+    valid_suffixes: a list of valid file suffixes which will only be considered for
+    validating. If None, defaults to [".xml"].
+
+    Returns a list of tuples of file paths and corresponding list of errors, which
+    is ``None`` if no errors.
+    """
+    with tempfile.TemporaryDirectory() as unzipDir:
+        with zipfile.ZipFile(file_path, "r") as zipFile:
+            zipFile.extractall(unzipDir)
+            return validate_directory(unzipDir, schema_path, valid_suffixes)
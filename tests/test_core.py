@@ -1,16 +1,28 @@
 """Test cases for the __core__ module."""
+import copy
 import os
+import subprocess
+import sys
 import zipfile
 from io import StringIO
 from pathlib import Path
-from typing import Callable, List, Tuple, Union
+from typing import Callable, Iterator, List, Tuple, Union
 
+import pytest
 from lxml import etree
 
 from pyecospold import (
+    parse_and_validate_file_v1,
+    parse_and_validate_file_v2,
+    parse_directory_iter_v1,
+    parse_directory_iter_v2,
     parse_directory_v1,
     parse_directory_v2,
+    parse_file_iter_v1,
+    parse_file_iter_v2,
     parse_file_v1,
+    parse_stream_v1,
+    parse_stream_v2,
     parse_zip_file_v1,
     parse_zip_file_v2,
     save_ecospold_file,
@@ -21,10 +33,56 @@ from pyecospold import (
     validate_zip_file_v1,
     validate_zip_file_v2,
 )
+from pyecospold.core import EcospoldLookupV1, EcospoldLookupV2
+from pyecospold.model_v1 import Dataset
 from pyecospold.model_v1 import EcoSpold as EcoSpoldV1
+from pyecospold.model_v2 import ActivityDataset
 from pyecospold.model_v2 import EcoSpold as EcoSpoldV2
 
 
+def test_import_defers_models() -> None:
+    """It doesn't import the Ecospold classes before they are needed."""
+    code = (
+        "import sys, pyecospold; "
+        "assert not {'pyecospold.model_v1', 'pyecospold.model_v2'} & set(sys.modules)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def _lookup_class(lookup: etree.ElementClassLookup, xml: str) -> type:
+    parser = etree.XMLParser()
+    parser.set_element_class_lookup(lookup)
+    return type(etree.fromstring(xml, parser))
+
+
+def test_lookup_v1() -> None:
+    """It maps Ecospold V1 elements and ignores elements of other namespaces."""
+    lookup = EcospoldLookupV1()
+    nameSpace = "http://www.EcoInvent.org/EcoSpold01"
+
+    assert _lookup_class(lookup, f'<dataset xmlns="{nameSpace}"/>') is Dataset
+    assert _lookup_class(lookup, f'<unknown xmlns="{nameSpace}"/>') is etree._Element
+    assert _lookup_class(lookup, "<dataset/>") is etree._Element
+
+
+def test_lookup_v2() -> None:
+    """It maps Ecospold V2 and V2 child elements and ignores elements of other
+    namespaces."""
+    lookup = EcospoldLookupV2()
+    nameSpace = "http://www.EcoInvent.org/EcoSpold02"
+    childNameSpace = "http://www.EcoInvent.org/EcoSpold02Child"
+
+    assert (
+        _lookup_class(lookup, f'<activityDataset xmlns="{nameSpace}"/>')
+        is ActivityDataset
+    )
+    assert (
+        _lookup_class(lookup, f'<childActivityDataset xmlns="{childNameSpace}"/>')
+        is ActivityDataset
+    )
+    assert _lookup_class(lookup, "<activityDataset/>") is etree._Element
+
+
 def test_validate_file_v1_success() -> None:
     """It validates file successfully."""
     assert validate_file_v1("data/v1/v1_1.xml") is None
@@ -47,6 +105,37 @@ def test_validate_file_v2_success() -> None:
     assert validate_file_v2("data/v2/v2_1.xml") is None
 
 
+def test_parse_and_validate_file_v1_success() -> None:
+    """It parses and validates file successfully."""
+    ecoSpold, errors = parse_and_validate_file_v1("data/v1/v1_1.xml")
+
+    assert isinstance(ecoSpold, EcoSpoldV1)
+    assert ecoSpold.datasets[0].generator == "EcoAdmin 1.1.17.110"
+    assert errors is None
+
+
+def test_parse_and_validate_file_v1_fail() -> None:
+    """It parses invalid file and returns its errors."""
+    xml = StringIO("<ecoSpold></ecoSpold>")
+    errorExpected = (
+        "<string>:1:0:ERROR:SCHEMASV:SCHEMAV_CVC_ELT_1: Element 'ecoSpold': "
+        "No matching global declaration available for the validation root."
+    )
+    ecoSpold, errors = parse_and_validate_file_v1(xml)
+
+    assert ecoSpold.tag == "ecoSpold"
+    assert errors is not None
+    assert str(errors[0]) == errorExpected
+
+
+def test_parse_and_validate_file_v2_success() -> None:
+    """It parses and validates file successfully."""
+    ecoSpold, errors = parse_and_validate_file_v2("data/v2/v2_1.xml")
+
+    assert isinstance(ecoSpold, EcoSpoldV2)
+    assert errors is None
+
+
 def test_parse_directory_v1() -> None:
     """It reads all files successfully."""
     dirPath = os.path.join(Path(__file__).parent.parent.resolve(), "data", "v1")
@@ -75,6 +164,113 @@ def test_parse_directory_v2() -> None:
     assert activity2.inheritanceDepth == 0
 
 
+def test_parse_file_iter_v1(tmpdir) -> None:
+    """It yields every dataset while releasing the processed ones."""
+    ecoSpold = parse_file_v1("data/v1/v1_1.xml")
+    dataset = copy.deepcopy(ecoSpold.datasets[0])
+    dataset.set("number", "2")
+    ecoSpold.append(dataset)
+    inputPath = os.path.join(tmpdir, "v1_multi.xml")
+    etree.ElementTree(ecoSpold).write(inputPath)
+
+    numbers = []
+    for dataset in parse_file_iter_v1(inputPath):
+        assert isinstance(dataset, Dataset)
+        assert dataset.generator == "EcoAdmin 1.1.17.110"
+        previous = dataset.getprevious()
+        assert previous is None or len(previous) == 0
+        numbers.append(dataset.number)
+
+    assert numbers == [1, 2]
+
+
+def test_parse_file_iter_v1_string_io() -> None:
+    """It yields every dataset of a StringIO representation."""
+    with open("data/v1/v1_1.xml", encoding="utf-8") as inputFile:
+        xml = StringIO(inputFile.read())
+    generators = []
+    for dataset in parse_file_iter_v1(xml):
+        assert isinstance(dataset, Dataset)
+        generators.append(dataset.generator)
+
+    assert generators == ["EcoAdmin 1.1.17.110"]
+
+
+def test_parse_file_iter_v1_string_io_declared_encoding() -> None:
+    """It rejects StringIO representations declaring a non-UTF-8 encoding, like
+    parse_file_v1."""
+    with open("data/v1/v1_1.xml", encoding="utf-8") as inputFile:
+        xml = (
+            inputFile.read()
+            .replace("encoding='UTF-8'", "encoding='ISO-8859-1'")
+            .replace("EcoAdmin 1.1.17.110", "EcoAdmin é")
+        )
+
+    with pytest.raises(ValueError, match="encoding declaration"):
+        parse_file_v1(StringIO(xml))
+    with pytest.raises(ValueError, match="encoding declaration"):
+        next(parse_file_iter_v1(StringIO(xml)))
+
+
+def test_parse_file_iter_v2() -> None:
+    """It yields child activity datasets."""
+    activityDatasets = list(parse_file_iter_v2("data/v2/v2_2.spold"))
+
+    assert len(activityDatasets) == 1
+    assert isinstance(activityDatasets[0], ActivityDataset)
+
+
+def _read_chunks(file_path: str, chunk_size: int = 1024) -> Iterator[bytes]:
+    with open(file_path, "rb") as inputFile:
+        while chunk := inputFile.read(chunk_size):
+            yield chunk
+
+
+def test_parse_stream_v1() -> None:
+    """It parses file chunks successfully."""
+    ecoSpold = parse_stream_v1(_read_chunks("data/v1/v1_1.xml"))
+
+    assert isinstance(ecoSpold, EcoSpoldV1)
+    assert ecoSpold.datasets[0].generator == "EcoAdmin 1.1.17.110"
+
+
+def test_parse_stream_v1_fail() -> None:
+    """It raises XMLSyntaxError for invalid chunks."""
+    with pytest.raises(etree.XMLSyntaxError):
+        parse_stream_v1([b"<ecoSpold>", b"</ecoSpold>"])
+
+
+def test_parse_stream_v2() -> None:
+    """It parses file chunks successfully."""
+    ecoSpold = parse_stream_v2(_read_chunks("data/v2/v2_1.xml"))
+    activity = ecoSpold.activityDataset.activityDescription.activity[0]
+
+    assert isinstance(ecoSpold, EcoSpoldV2)
+    assert activity.inheritanceDepth == 0
+
+
+def test_parse_directory_iter_v1() -> None:
+    """It lazily reads all files successfully."""
+    dirPath = os.path.join(Path(__file__).parent.parent.resolve(), "data", "v1")
+    ecospoldIter = parse_directory_iter_v1(dirPath)
+    ecospoldList = sorted(ecospoldIter)
+
+    assert isinstance(ecospoldIter, Iterator)
+    assert [filePath.name for filePath, _ in ecospoldList] == ["v1_1.xml", "v1_2.spold"]
+    for _, ecoSpold in ecospoldList:
+        assert ecoSpold.datasets[0].generator == "EcoAdmin 1.1.17.110"
+
+
+def test_parse_directory_iter_v2() -> None:
+    """It lazily reads all files successfully."""
+    dirPath = os.path.join(Path(__file__).parent.parent.resolve(), "data", "v2")
+    ecospoldList = sorted(parse_directory_iter_v2(dirPath, [".spold"]))
+
+    assert len(ecospoldList) == 1
+    assert ecospoldList[0][0] == Path(dirPath, "v2_2.spold")
+    assert isinstance(ecospoldList[0][1], EcoSpoldV2)
+
+
 def test_save_file(tmpdir) -> None:
     """It saves read file correctly."""
     inputPath = "data/v1/v1_1.xml"
@@ -90,6 +286,19 @@ def test_save_file(tmpdir) -> None:
             assert translatedOutput == translatedInput
 
 
+def test_save_file_not_pretty(tmpdir) -> None:
+    """It saves read file without indentation."""
+    inputPath = "data/v1/v1_1.xml"
+    metaInformation = parse_file_v1(inputPath)
+    outputPath = os.path.join(tmpdir, os.urandom(24).hex())
+    save_ecospold_file(metaInformation, outputPath, pretty_print=False)
+
+    with open(outputPath, encoding="utf-8") as outputFile:
+        lines = outputFile.read().splitlines()
+    assert len(lines) == 2
+    assert parse_file_v1(outputPath).datasets[0].generator == "EcoAdmin 1.1.17.110"
+
+
 def test_save_file_defaults(tmpdir) -> None:
     """It saves read file correctly."""
     inputPath = "data/v1/v1_1.xml"
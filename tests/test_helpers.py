@@ -1,5 +1,6 @@
 """Test cases for the __helpers__ module."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 
 import pytest
@@ -31,6 +32,28 @@ def test_set_attribute_fail(process_information: ProcessInformation) -> None:
         process_information.referenceFunction.amount = "abc"
 
 
+def _set_invalid_attribute(i: int) -> str:
+    ecoSpold = parse_file_v1("data/v1/v1_1.xml")
+    dataset = ecoSpold.datasets[0]
+    try:
+        if i % 2:
+            dataset.metaInformation.processInformation.referenceFunction.amount = "abc"
+        else:
+            dataset.number = "abc"
+    except DocumentInvalid as error:
+        return str(error)
+    return ""
+
+
+def test_set_attribute_fail_concurrent() -> None:
+    "It raises DocumentInvalid error with its own error when setting concurrently."
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        errors = list(executor.map(_set_invalid_attribute, range(400)))
+
+    for i, error in enumerate(errors):
+        assert f"attribute '{'amount' if i % 2 else 'number'}'" in error
+
+
 def test_set_attribute_success(process_information: ProcessInformation) -> None:
     "It sets attribute correctly."
     amount = 2.0
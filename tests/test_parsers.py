@@ -0,0 +1,157 @@
+"""Test cases for the __parsers__ module."""
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
+from typing import List, Tuple, Union
+
+import pytest
+from lxml import etree
+
+from pyecospold.config import Defaults
+from pyecospold.core import EcospoldLookupV1, EcospoldLookupV2
+from pyecospold.model_v1 import EcoSpold
+from pyecospold.parsers import (
+    _get_parser,
+    _get_schema,
+    _list_files,
+    parse_and_validate,
+    parse_directory,
+    parse_file,
+    validate_file,
+)
+
+
+def test_get_schema_cached() -> None:
+    """It compiles each schema only once."""
+    assert _get_schema(Defaults.SCHEMA_V1_FILE) is _get_schema(Defaults.SCHEMA_V1_FILE)
+    assert _get_schema(Defaults.SCHEMA_V1_FILE) is not _get_schema(
+        Defaults.SCHEMA_V2_FILE
+    )
+
+
+def test_get_schema_per_thread() -> None:
+    """It compiles a separate schema for every thread."""
+    schema = _get_schema(Defaults.SCHEMA_V1_FILE)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        threadSchema = executor.submit(_get_schema, Defaults.SCHEMA_V1_FILE).result()
+
+    assert threadSchema is not schema
+
+
+def _invalid_v2() -> bytes:
+    with open("data/v2/v2_1.xml", "rb") as inputFile:
+        return inputFile.read().replace(
+            b'inheritanceDepth="0"', b'inheritanceDepth="x"'
+        )
+
+
+def test_validate_file_concurrent() -> None:
+    """It returns the errors of every invalid file validated concurrently."""
+    xml = _invalid_v2()
+
+    def validate(_) -> Union[None, List[str]]:
+        return validate_file(BytesIO(xml), Defaults.SCHEMA_V2_FILE)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(validate, range(2000)))
+
+    for errors in results:
+        assert errors is not None and len(errors) > 0
+
+
+def test_parse_and_validate_concurrent() -> None:
+    """It returns the errors of every invalid file parsed concurrently."""
+    xml = _invalid_v2()
+
+    def parse(_) -> Tuple[etree.ElementBase, Union[None, List[str]]]:
+        return parse_and_validate(
+            BytesIO(xml), Defaults.SCHEMA_V2_FILE, EcospoldLookupV2
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(parse, range(2000)))
+
+    for ecoSpold, errors in results:
+        assert ecoSpold is not None
+        assert errors is not None and len(errors) > 0
+
+
+def test_validate_file_reuses_schema() -> None:
+    """It validates files successfully with a shared schema."""
+    assert validate_file("data/v1/v1_1.xml", Defaults.SCHEMA_V1_FILE) is None
+    assert validate_file("data/v1/v1_2.spold", Defaults.SCHEMA_V1_FILE) is None
+
+
+def test_get_parser_cached() -> None:
+    """It builds each parser only once per schema and lookup class."""
+    parser = _get_parser(Defaults.SCHEMA_V1_FILE, EcospoldLookupV1)
+
+    assert parser is _get_parser(Defaults.SCHEMA_V1_FILE, EcospoldLookupV1)
+    assert parser is not _get_parser(Defaults.SCHEMA_V2_FILE, EcospoldLookupV2)
+
+
+def test_get_parser_per_thread() -> None:
+    """It builds a separate parser for every thread."""
+    parser = _get_parser(Defaults.SCHEMA_V1_FILE, EcospoldLookupV1)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        threadParser = executor.submit(
+            _get_parser, Defaults.SCHEMA_V1_FILE, EcospoldLookupV1
+        ).result()
+
+    assert threadParser is not parser
+
+
+def test_parse_directory_parallel(tmpdir) -> None:
+    """It parses all files in a thread pool."""
+    for i in range(8):
+        shutil.copy("data/v1/v1_1.xml", os.path.join(tmpdir, f"v1_{i}.xml"))
+    results = parse_directory(
+        tmpdir, Defaults.SCHEMA_V1_FILE, EcospoldLookupV1, max_workers=4
+    )
+
+    assert len(results) == 8
+    for _, ecoSpold in results:
+        assert isinstance(ecoSpold, EcoSpold)
+        assert ecoSpold.datasets[0].generator == "EcoAdmin 1.1.17.110"
+
+
+def test_list_files(tmpdir) -> None:
+    """It lists only files having a valid suffix."""
+    os.mkdir(os.path.join(tmpdir, "dir.xml"))
+    for fileName in ["a.xml", "b.XML", "c.txt", ".xml"]:
+        with open(os.path.join(tmpdir, fileName), "w", encoding="utf-8"):
+            pass
+    for validSuffixes in [[".xml"], [".XML", ".spold"]]:
+        filePaths = sorted(
+            os.path.basename(path) for path in _list_files(tmpdir, validSuffixes)
+        )
+        assert filePaths == ["a.xml", "b.XML"]
+
+
+def test_parse_file_entities_unresolved(tmpdir) -> None:
+    """It doesn't resolve external entities."""
+    secretPath = os.path.join(tmpdir, "secret.txt")
+    with open(secretPath, "w", encoding="utf-8") as secretFile:
+        secretFile.write("<secret>top secret content</secret>")
+    with open("data/v2/v2_1.xml", encoding="utf-8-sig") as inputFile:
+        xml = inputFile.read()
+    xml = xml.replace(
+        "<ecoSpold",
+        f'<!DOCTYPE ecoSpold [<!ENTITY secret SYSTEM "file://{secretPath}">]>\n'
+        "<ecoSpold",
+        1,
+    ).replace("particle board production, cement bonded", "&secret;", 1)
+    inputPath = os.path.join(tmpdir, "v2_entity.xml")
+    with open(inputPath, "w", encoding="utf-8") as inputFile:
+        inputFile.write(xml)
+    ecoSpold = parse_file(inputPath, Defaults.SCHEMA_V2_FILE, EcospoldLookupV2)
+
+    assert "top secret content" not in "".join(ecoSpold.itertext())
+    assert validate_file(inputPath, Defaults.SCHEMA_V2_FILE) is None
+    ecoSpold, errors = parse_and_validate(
+        inputPath, Defaults.SCHEMA_V2_FILE, EcospoldLookupV2
+    )
+
+    assert "top secret content" not in "".join(ecoSpold.itertext())
+    assert errors is None